@@ -3,18 +3,70 @@ List Controller
 Gestiona la lógica de negocio de listas avanzadas
 """
 
-import sys
+import json
+import time
 import logging
-from pathlib import Path
 from typing import List, Dict, Any, Optional
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, QThread, QMutex, QWaitCondition, QCoreApplication, pyqtSignal
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from database.db_manager import DBManager
 from core.clipboard_manager import ClipboardManager
 
 logger = logging.getLogger(__name__)
 
+# Decoder reutilizable para los tags almacenados como JSON
+_JSON_DECODE = json.JSONDecoder().decode
+
+# Límites de validación de listas
+_MAX_NAME_LENGTH = 100
+_MAX_ITEMS = 50
+_MAX_LABEL_LENGTH = 200
+
+# Intervalo mínimo entre emisiones de execution_step (~1 frame a 60 Hz)
+_STEP_EMIT_INTERVAL_NS = 16_000_000
+
+
+class _SequentialRunner(QThread):
+    """
+    Hilo que marca el ritmo de la ejecución secuencial de una lista
+
+    Solo espera entre pasos y emite step_ready; el acceso al clipboard se hace
+    en el hilo de la UI (conexión encolada hacia ListController).
+    """
+
+    step_ready = pyqtSignal(int, str, str)  # (step_number, label, content)
+
+    def __init__(self, items: List[Dict[str, Any]], delay_ms: int):
+        super().__init__()
+        self._steps = [(item['label'], item['content']) for item in items]
+        self._delay_ms = delay_ms
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._stop = False
+
+    def run(self):
+        """Emite cada paso esperando delay_ms entre ellos (interrumpible con stop())"""
+        for step_number, (label, content) in enumerate(self._steps, start=1):
+            if step_number > 1:
+                self._mutex.lock()
+                try:
+                    if not self._stop:
+                        self._wake.wait(self._mutex, self._delay_ms)
+                finally:
+                    self._mutex.unlock()
+
+            if self._stop:
+                return
+
+            self.step_ready.emit(step_number, label, content)
+
+    def stop(self):
+        """Solicita detener la ejecución y despierta la espera actual"""
+        self._mutex.lock()
+        self._stop = True
+        self._wake.wakeAll()
+        self._mutex.unlock()
+
 
 class ListController(QObject):
     """
@@ -60,11 +112,13 @@ class ListController(QObject):
         self.clipboard_manager = clipboard_manager or ClipboardManager()
 
         # Estado de ejecución secuencial
-        self._execution_timer = None
+        self._execution_runner = None
+        self._quit_hook_connected = False  # aboutToQuit -> cancel_execution (se conecta una vez)
         self._execution_items = []
         self._execution_index = 0
         self._execution_list_name = ""
         self._execution_list_id = 0  # NUEVO: Guardar lista_id en ejecución
+        self._last_step_emit_ns = 0
 
         logger.info("ListController initialized")
 
@@ -84,31 +138,62 @@ class ListController(QObject):
         Returns:
             Tuple (is_valid, error_message)
         """
-        # Validar nombre de lista
+        is_valid, error_msg = self._validate_name(list_name, category_id, exclude_list_id)
+        if not is_valid:
+            return is_valid, error_msg
+
+        return self._validate_items(items_data)
+
+    def _validate_name(self, list_name: str, category_id: int = None,
+                       exclude_list_id: int = None) -> tuple[bool, str]:
+        """
+        Valida el nombre de una lista (incluye unicidad en BD si hay category_id)
+
+        Args:
+            list_name: Nombre de la lista
+            category_id: ID de categoría (para validar nombre único)
+            exclude_list_id: ID de lista a excluir en validación (para edición)
+
+        Returns:
+            Tuple (is_valid, error_message)
+        """
         if not list_name or not list_name.strip():
             return False, "El nombre de la lista no puede estar vacío"
 
-        if len(list_name) > 100:
-            return False, "El nombre de la lista es demasiado largo (máximo 100 caracteres)"
+        if len(list_name) > _MAX_NAME_LENGTH:
+            return False, f"El nombre de la lista es demasiado largo (máximo {_MAX_NAME_LENGTH} caracteres)"
 
         # Validar unicidad del nombre (usando método de DBManager)
         if category_id is not None:
             if not self.db.is_lista_name_unique(category_id, list_name, exclude_id=exclude_list_id):
                 return False, f"Ya existe una lista con el nombre '{list_name}' en esta categoría"
 
-        # Validar items
-        if not items_data or len(items_data) == 0:
+        return True, ""
+
+    def _validate_items(self, items_data: List[Dict[str, Any]]) -> tuple[bool, str]:
+        """
+        Valida los items/pasos de una lista (sin acceso a BD)
+
+        Args:
+            items_data: Lista de datos de items
+
+        Returns:
+            Tuple (is_valid, error_message)
+        """
+        item_count = len(items_data) if items_data else 0
+        if not item_count:
             return False, "La lista debe tener al menos un paso/item"
 
-        if len(items_data) > 50:
-            return False, "La lista no puede tener más de 50 pasos"
+        if item_count > _MAX_ITEMS:
+            return False, f"La lista no puede tener más de {_MAX_ITEMS} pasos"
 
         # Validar cada item
         for i, item in enumerate(items_data, 1):
-            if not item.get('label'):
+            label = item.get('label') or ''
+            if not label:
                 return False, f"El paso #{i} debe tener un nombre/label"
 
-            if len(item.get('label', '')) > 200:
+            if len(label) > _MAX_LABEL_LENGTH:
                 return False, f"El nombre del paso #{i} es demasiado largo"
 
         return True, ""
@@ -135,26 +220,31 @@ class ListController(QObject):
             if list_name:
                 auto_tags.append(list_name)
 
-            # Obtener datos de los items existentes
+            # Obtener datos de los items existentes (una sola consulta)
+            items_map = self.db.get_items_by_ids(item_ids)
             items_data = []
             for item_id in item_ids:
-                # Obtener item de la BD
-                item = self.db.get_item(item_id)
+                item = items_map.get(item_id)
                 if item:
                     # Obtener tags existentes del item
                     existing_tags = item.get('tags', [])
                     if isinstance(existing_tags, str):
-                        # Parsear si viene como string
-                        try:
-                            import json
-                            existing_tags = json.loads(existing_tags)
-                        except:
-                            existing_tags = [tag.strip() for tag in existing_tags.split(',') if tag.strip()]
+                        # Parsear si viene como string: JSON si parece un array, si no CSV (legacy)
+                        tags_str = existing_tags.lstrip()
+                        if tags_str.startswith('['):
+                            try:
+                                existing_tags = _JSON_DECODE(tags_str)
+                            except json.JSONDecodeError:
+                                existing_tags = []
+                        else:
+                            existing_tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
 
                     # Combinar tags automáticos con tags existentes (sin duplicados)
                     combined_tags = auto_tags.copy()
+                    seen_tags = set(auto_tags)
                     for tag in existing_tags:
-                        if tag and tag not in combined_tags:
+                        if tag and tag not in seen_tags:
+                            seen_tags.add(tag)
                             combined_tags.append(tag)
 
                     # Crear dict con los datos necesarios para la lista
@@ -209,25 +299,13 @@ class ListController(QObject):
             return False, error_msg, 0, []
 
         try:
-            # 1. Crear registro en tabla listas
-            lista_id = self.db.create_lista(category_id, list_name, description)
-
-            # 2. Crear items con list_id
-            item_ids = []
-            for i, item_data in enumerate(items_data, start=1):
-                item_id = self.db.add_item(
-                    category_id=category_id,
-                    label=item_data.get('label', ''),
-                    content=item_data.get('content', ''),
-                    item_type=item_data.get('type', 'text'),
-                    icon=item_data.get('icon'),
-                    description=item_data.get('description'),
-                    is_sensitive=item_data.get('is_sensitive', False),
-                    tags=item_data.get('tags', []),
-                    list_id=lista_id,  # NUEVO: FK a tabla listas
-                    orden_lista=i
-                )
-                item_ids.append(item_id)
+            # Lista + items en una sola transacción (un único COMMIT/fsync)
+            with self.db.transaction():
+                # 1. Crear registro en tabla listas
+                lista_id = self.db.create_lista(category_id, list_name, description)
+
+                # 2. Crear items con list_id (un único INSERT preparado)
+                item_ids = self.db.add_items_bulk(category_id, items_data, list_id=lista_id)
 
             logger.info(f"Lista creada exitosamente: '{list_name}' (id={lista_id}, {len(item_ids)} items)")
 
@@ -270,54 +348,35 @@ class ListController(QObject):
             old_name = lista['name']
             category_id = lista['category_id']
 
-            # Si se está renombrando, validar nuevo nombre
+            # Si se está renombrando, validar nuevo nombre (única consulta de unicidad)
             if new_name and new_name != old_name:
-                is_valid, error_msg = self.validate_list_data(
-                    new_name, items_data or [], category_id, exclude_list_id=lista_id
-                )
-                if not is_valid and "al menos un" not in error_msg:  # Ignorar error de items vacíos si solo renombramos
+                is_valid, error_msg = self._validate_name(new_name, category_id, exclude_list_id=lista_id)
+                if not is_valid:
                     self.error_occurred.emit(error_msg)
                     return False, error_msg
 
             # Si se están actualizando items, validar
             if items_data is not None:
-                final_name = new_name if new_name else old_name
-                is_valid, error_msg = self.validate_list_data(final_name, items_data, category_id, exclude_list_id=lista_id)
+                is_valid, error_msg = self._validate_items(items_data)
                 if not is_valid:
                     self.error_occurred.emit(error_msg)
                     return False, error_msg
 
-            # 1. Actualizar metadata de lista
-            updates = {}
-            if new_name:
-                updates['name'] = new_name
-            if description is not None:
-                updates['description'] = description
+            # Metadata + items en una sola transacción: si algo falla se revierte todo
+            with self.db.transaction():
+                # 1. Actualizar metadata de lista
+                updates = {}
+                if new_name:
+                    updates['name'] = new_name
+                if description is not None:
+                    updates['description'] = description
 
-            if updates:
-                self.db.update_lista(lista_id, **updates)
+                if updates:
+                    self.db.update_lista(lista_id, **updates)
 
-            # 2. Si hay items_data, actualizar items (eliminar viejos, crear nuevos)
-            if items_data is not None:
-                # Eliminar items actuales de la lista
-                current_items = self.db.get_items_by_lista(lista_id)
-                for item in current_items:
-                    self.db.delete_item(item['id'])
-
-                # Crear nuevos items
-                for i, item_data in enumerate(items_data, start=1):
-                    self.db.add_item(
-                        category_id=category_id,
-                        label=item_data.get('label', ''),
-                        content=item_data.get('content', ''),
-                        item_type=item_data.get('type', 'text'),
-                        icon=item_data.get('icon'),
-                        description=item_data.get('description'),
-                        is_sensitive=item_data.get('is_sensitive', False),
-                        tags=item_data.get('tags', []),
-                        list_id=lista_id,
-                        orden_lista=i
-                    )
+                # 2. Si hay items_data, sincronizar items (solo el delta)
+                if items_data is not None:
+                    self._sync_list_items(lista_id, category_id, items_data)
 
             final_name = new_name if new_name else old_name
             logger.info(f"Lista actualizada exitosamente: '{old_name}' -> '{final_name}' (id={lista_id})")
@@ -339,6 +398,69 @@ class ListController(QObject):
             self.error_occurred.emit(error_msg)
             return False, error_msg
 
+    def _sync_list_items(self, lista_id: int, category_id: int,
+                         items_data: List[Dict[str, Any]]) -> None:
+        """
+        Sincroniza los items de una lista comparando paso a paso (método interno)
+
+        Los items actuales se emparejan por su posición en la lista ordenada, no
+        por el valor de orden_lista (que puede repetirse o empezar en 0). Solo se
+        escribe el delta: UPDATE de los pasos modificados (incluido orden_lista si
+        no coincide), INSERT de los pasos nuevos y DELETE de todos los sobrantes.
+        Los items sin cambios conservan su id (y con él historial y referencias).
+
+        Args:
+            lista_id: ID de la lista
+            category_id: ID de la categoría
+            items_data: Nuevos datos de items, en orden
+        """
+        rows = self.db.get_items_by_lista(lista_id)
+        current_tags = self.db.get_tags_by_lista(lista_id)
+
+        new_items = []
+        updated = 0
+        for i, item_data in enumerate(items_data, start=1):
+            if i > len(rows):
+                new_items.append({**item_data, 'orden_lista': i})
+                continue
+            item = rows[i - 1]
+
+            target = {
+                'label': item_data.get('label', ''),
+                'content': item_data.get('content', ''),
+                'type': item_data.get('type', 'TEXT'),
+                'icon': item_data.get('icon'),
+                'description': item_data.get('description'),
+                'is_sensitive': bool(item_data.get('is_sensitive', False)),
+            }
+            item['is_sensitive'] = bool(item.get('is_sensitive'))
+            changes = {field: value for field, value in target.items() if item.get(field) != value}
+            # Al cambiar la sensibilidad hay que reescribir el contenido (cifrado/descifrado)
+            if 'is_sensitive' in changes:
+                changes['content'] = target['content']
+
+            new_tags = sorted({tag.strip().lower() for tag in item_data.get('tags') or [] if tag.strip()})
+            if new_tags != current_tags.get(item['id'], []):
+                changes['tags'] = new_tags
+
+            if item.get('orden_lista') != i:
+                changes['orden_lista'] = i
+
+            if changes:
+                self.db.update_item(item['id'], **changes)
+                updated += 1
+
+        # Pasos que ya no existen en la lista (incluidos duplicados de orden_lista)
+        removed = rows[len(items_data):]
+        for item in removed:
+            self.db.delete_item(item['id'])
+
+        if new_items:
+            self.db.add_items_bulk(category_id, new_items, list_id=lista_id)
+
+        logger.debug(f"Items de lista {lista_id} sincronizados: {updated} actualizados, "
+                     f"{len(new_items)} creados, {len(removed)} eliminados")
+
     def delete_list(self, lista_id: int) -> tuple[bool, str]:
         """
         Elimina una lista completa (nueva arquitectura v3.1.0)
@@ -460,21 +582,18 @@ class ListController(QObject):
             if not lista:
                 return False, f"Lista con ID {lista_id} no encontrada"
 
-            items = self.get_list_items(lista_id)
+            # Concatenar contenidos directamente en SQL (group_concat)
+            combined_content, item_count = self.db.get_lista_concatenated_content(lista_id, separator)
 
-            if not items:
+            if not item_count:
                 return False, "La lista está vacía"
 
-            # Concatenar contenidos
-            contents = [item['content'] for item in items]
-            combined_content = separator.join(contents)
-
             # Copiar al clipboard
             success = self.clipboard_manager.copy_text(combined_content)
 
             if success:
-                logger.info(f"Contenido completo de lista '{lista['name']}' (id={lista_id}) copiado al clipboard ({len(items)} items)")
-                return True, f"Copiados {len(items)} pasos de '{lista['name']}'"
+                logger.info(f"Contenido completo de lista '{lista['name']}' (id={lista_id}) copiado al clipboard ({item_count} items)")
+                return True, f"Copiados {item_count} pasos de '{lista['name']}'"
             else:
                 return False, "Error al copiar al clipboard"
 
@@ -520,21 +639,19 @@ class ListController(QObject):
             self._execution_index = 0
             self._execution_list_id = lista_id  # Guardar lista_id en lugar de list_name
             self._execution_list_name = lista['name']  # Mantener para logs
+            self._last_step_emit_ns = 0
 
-            # Crear y configurar timer
-            self._execution_timer = QTimer()
-            self._execution_timer.timeout.connect(self._execute_next_step)
+            # Crear hilo secuenciador (los pasos llegan encolados al hilo de la UI)
+            self._execution_runner = _SequentialRunner(items, delay_ms)
+            self._execution_runner.step_ready.connect(self._execute_step)
+            self._execution_runner.finished.connect(self._on_runner_finished)
+            self._connect_quit_hook()
 
             # Emitir señal de inicio
             self.execution_started.emit(lista_id, len(items))
             logger.info(f"Iniciando ejecución secuencial de lista '{lista['name']}' (id={lista_id}, {len(items)} pasos, {delay_ms}ms delay)")
 
-            # Ejecutar primer paso inmediatamente
-            self._execute_next_step()
-
-            # Iniciar timer para siguientes pasos
-            if len(items) > 1:
-                self._execution_timer.start(delay_ms)
+            self._execution_runner.start()
 
             return True
 
@@ -544,39 +661,62 @@ class ListController(QObject):
             self.error_occurred.emit(error_msg)
             return False
 
-    def _execute_next_step(self):
-        """Ejecuta el siguiente paso de la lista (método interno)"""
-        if self._execution_index >= len(self._execution_items):
-            # Ejecución completada
-            self._finish_execution()
-            return
-
-        # Obtener item actual
-        item = self._execution_items[self._execution_index]
-        step_number = self._execution_index + 1
+    def _execute_step(self, step_number: int, label: str, content: str):
+        """Ejecuta un paso emitido por el secuenciador (método interno, hilo de la UI)"""
+        if self.sender() is not self._execution_runner:
+            return  # Paso pendiente de una ejecución ya cancelada
 
         try:
             # Copiar contenido al clipboard
-            self.clipboard_manager.copy_text(item['content'])
+            self.clipboard_manager.copy_text(content)
 
-            # Emitir señal de paso ejecutado
-            self.execution_step.emit(step_number, item['label'])
-            logger.debug(f"Paso {step_number}/{len(self._execution_items)} ejecutado: {item['label']}")
+            # Emitir señal de paso ejecutado, limitada a una por frame para no
+            # saturar la UI con delays pequeños (el último paso siempre se emite)
+            now_ns = time.monotonic_ns()
+            if (step_number == len(self._execution_items)
+                    or now_ns - self._last_step_emit_ns > _STEP_EMIT_INTERVAL_NS):
+                self._last_step_emit_ns = now_ns
+                self.execution_step.emit(step_number, label)
+            logger.debug(f"Paso {step_number}/{len(self._execution_items)} ejecutado: {label}")
 
-            # Incrementar índice
-            self._execution_index += 1
+            self._execution_index = step_number
 
         except Exception as e:
             logger.error(f"Error al ejecutar paso {step_number}: {e}")
             self._finish_execution()
 
+    def _connect_quit_hook(self):
+        """
+        Cancela la ejecución al cerrar la aplicación (método interno)
+
+        Así el hilo secuenciador siempre se detiene y se espera antes de que Qt
+        destruya su wrapper ("QThread: Destroyed while thread is still running").
+        """
+        if self._quit_hook_connected:
+            return
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.cancel_execution)
+            self._quit_hook_connected = True
+
+    def _on_runner_finished(self):
+        """El secuenciador terminó todos los pasos (método interno)"""
+        if self.sender() is self._execution_runner:
+            self._finish_execution()
+
+    def _stop_runner(self):
+        """Detiene y libera el hilo secuenciador actual (método interno)"""
+        runner = self._execution_runner
+        self._execution_runner = None
+        if runner is not None:
+            runner.stop()
+            runner.wait()
+
     def _finish_execution(self):
         """Finaliza la ejecución secuencial"""
-        if self._execution_timer:
-            self._execution_timer.stop()
-            self._execution_timer = None
+        self._stop_runner()
 
-        lista_id = getattr(self, '_execution_list_id', 0)
+        lista_id = self._execution_list_id
         list_name = self._execution_list_name
         self._execution_items = []
         self._execution_index = 0
@@ -588,9 +728,8 @@ class ListController(QObject):
 
     def cancel_execution(self):
         """Cancela la ejecución secuencial actual"""
-        if self._execution_timer and self._execution_timer.isActive():
-            self._execution_timer.stop()
-            self._execution_timer = None
+        if self._execution_runner is not None:
+            self._stop_runner()
             self._execution_items = []
             self._execution_index = 0
             self._execution_list_name = ""
@@ -601,4 +740,4 @@ class ListController(QObject):
 
     def is_executing(self) -> bool:
         """Retorna True si hay una ejecución secuencial en curso"""
-        return self._execution_timer is not None and self._execution_timer.isActive()
+        return self._execution_runner is not None
@@ -129,6 +129,23 @@ class GlobalTagManager:
             logger.error(f"Error getting global tag by id {tag_id}: {e}")
             return None
             
+    def get_tags(self, tag_ids: List[int]) -> List[ProjectElementTag]:
+        """
+        Get several tags by ID with a single query.
+        
+        Args:
+            tag_ids: List of tag IDs
+            
+        Returns:
+            List of ProjectElementTag objects (missing IDs are skipped)
+        """
+        try:
+            rows = self.db.get_tags_by_ids(list(tag_ids))
+            return [self._dict_to_tag(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting global tags by ids {tag_ids}: {e}")
+            return []
+            
     def get_tag_by_name(self, name: str) -> Optional[ProjectElementTag]:
         """
         Get a tag by name.
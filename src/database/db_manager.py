@@ -21,6 +21,29 @@ logger = logging.getLogger(__name__)
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
+    # sqlite3 cachea sentencias preparadas por conexión, indexadas por el texto
+    # SQL. El manager tiene cientos de consultas distintas, así que se amplía el
+    # caché por defecto (128) para que las del camino caliente no sean expulsadas.
+    _STATEMENT_CACHE_SIZE = 512
+
+    # SQL del camino caliente de listas (mismo texto -> misma sentencia compilada)
+    _SQL_INSERT_LIST_ITEMS = """
+        INSERT INTO items
+        (category_id, label, content, type, icon, description, is_sensitive,
+         list_id, orden_lista, component_config, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '{}', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    """
+    _SQL_INSERT_ITEM_TAG = "INSERT OR IGNORE INTO item_tags (item_id, tag_id, created_at) VALUES (?, ?, CURRENT_TIMESTAMP)"
+    _SQL_BUMP_TAG_USAGE = "UPDATE tags SET usage_count = usage_count + ?, last_used = CURRENT_TIMESTAMP WHERE id = ?"
+    _SQL_SELECT_LISTA = "SELECT * FROM listas WHERE id = ?"
+    _SQL_SELECT_ITEMS_BY_LISTA = """
+        SELECT i.*, l.name as lista_name
+        FROM items i
+        JOIN listas l ON i.list_id = l.id
+        WHERE i.list_id = ?
+        ORDER BY i.orden_lista ASC, i.id ASC
+    """
+
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """
         Initialize database manager
@@ -31,6 +54,7 @@ class DBManager:
         self.db_path = Path(db_path)
         self.connection = None
         self._fts5_available = None  # Caché para verificación de FTS5
+        self._transaction_depth = 0  # Profundidad de transacciones anidadas
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -43,6 +67,24 @@ class DBManager:
             self._create_database()
         else:
             logger.info("Database already exists")
+            self._ensure_list_indexes()
+
+    def _ensure_list_indexes(self):
+        """
+        Ensure the (list_id, orden_lista) index exists on databases created
+        before it was part of the schema. Lets get_items_by_lista() and
+        get_lista_concatenated_content() read a list as an index range scan,
+        already ordered, without a temp B-tree sort.
+        """
+        try:
+            conn = self.connect()
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_list_orden "
+                "ON items(list_id, orden_lista) WHERE list_id IS NOT NULL"
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not ensure list indexes: {e}")
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -54,11 +96,15 @@ class DBManager:
         if self.connection is None:
             self.connection = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=self._STATEMENT_CACHE_SIZE
             )
             self.connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
+            # WAL + synchronous=NORMAL: un solo fsync por transacción en checkpoint
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
         return self.connection
 
     def close(self):
@@ -73,18 +119,27 @@ class DBManager:
         """
         Context manager for database transactions
 
+        Las transacciones son re-entrantes: solo la más externa hace
+        COMMIT/ROLLBACK, y execute_update() no confirma mientras haya una
+        transacción abierta. Así varias escrituras se agrupan en un único fsync.
+
         Usage:
             with db.transaction() as conn:
                 conn.execute(...)
         """
         conn = self.connect()
+        self._transaction_depth += 1
         try:
             yield conn
-            conn.commit()
+            if self._transaction_depth == 1:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
-            logger.error(f"Transaction failed: {e}")
+            if self._transaction_depth == 1:
+                conn.rollback()
+                logger.error(f"Transaction failed: {e}")
             raise
+        finally:
+            self._transaction_depth -= 1
 
     def _create_database(self):
         """Create database schema with all tables and indices - COMPLETE SCHEMA"""
@@ -589,7 +644,9 @@ class DBManager:
             conn = self.connect()
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
+            # Dentro de transaction() el COMMIT lo hace la transacción externa
+            if not self._transaction_depth:
+                conn.commit()
             return cursor.lastrowid
         except sqlite3.Error as e:
             logger.error(f"Update execution failed: {e}")
@@ -1577,6 +1634,55 @@ class DBManager:
             return item
         return None
 
+    def get_items_by_ids(self, item_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Get several items by ID with a single query (batch version of get_item)
+
+        Args:
+            item_ids: Item IDs
+
+        Returns:
+            Dict[int, Dict]: item_id -> item dictionary (content decrypted if
+            sensitive). Missing IDs are not included
+        """
+        if not item_ids:
+            return {}
+
+        placeholders = ','.join('?' * len(item_ids))
+        query = f"SELECT * FROM items WHERE id IN ({placeholders})"
+        items = {item['id']: item for item in self.execute_query(query, tuple(item_ids))}
+        if not items:
+            return {}
+
+        # Load tags from relational structure in one query
+        for item in items.values():
+            item['tags'] = []
+        query = f"""
+            SELECT it.item_id, t.name
+            FROM item_tags it
+            JOIN tags t ON it.tag_id = t.id
+            WHERE it.item_id IN ({','.join('?' * len(items))})
+            ORDER BY t.name
+        """
+        for row in self.execute_query(query, tuple(items)):
+            items[row['item_id']]['tags'].append(row['name'])
+
+        # Decrypt sensitive content
+        encryption_manager = None
+        for item_id, item in items.items():
+            if item.get('is_sensitive') and item.get('content'):
+                if encryption_manager is None:
+                    from src.core.encryption_manager import EncryptionManager
+                    encryption_manager = EncryptionManager()
+                try:
+                    item['content'] = encryption_manager.decrypt(item['content'])
+                    logger.debug(f"Content decrypted for item ID: {item_id}")
+                except Exception as e:
+                    logger.error(f"Failed to decrypt item {item_id}: {e}")
+                    item['content'] = "[DECRYPTION ERROR]"
+
+        return items
+
     def get_item_by_hash(self, file_hash: str) -> Optional[Dict]:
         """
         Get item by file hash (for duplicate detection)
@@ -1794,6 +1900,72 @@ class DBManager:
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info}{tags_info})")
         return item_id
 
+    def add_items_bulk(self, category_id: int, items_data: List[Dict[str, Any]],
+                       list_id: int = None) -> List[int]:
+        """
+        Add several items with a single prepared INSERT (executemany)
+
+        Args:
+            category_id: Category ID
+            items_data: List of dicts (label, content, type, icon, description,
+                        is_sensitive, tags, orden_lista). If list_id is given and
+                        a dict has no orden_lista, its 1-based position is used
+            list_id: Lista ID (FK a tabla listas, optional)
+
+        Returns:
+            List[int]: New item IDs, in the same order as items_data
+        """
+        if not items_data:
+            return []
+
+        encryption_manager = None
+        rows = []
+        for orden, item_data in enumerate(items_data, start=1):
+            content = item_data.get('content', '')
+            is_sensitive = item_data.get('is_sensitive', False)
+            if is_sensitive and content:
+                if encryption_manager is None:
+                    from src.core.encryption_manager import EncryptionManager
+                    encryption_manager = EncryptionManager()
+                content = encryption_manager.encrypt(content)
+
+            rows.append((
+                category_id, item_data.get('label', ''), content,
+                item_data.get('type', 'TEXT'), item_data.get('icon'),
+                item_data.get('description'), is_sensitive,
+                list_id, item_data.get('orden_lista', orden) if list_id is not None else 0
+            ))
+
+        with self.transaction() as conn:
+            conn.executemany(self._SQL_INSERT_LIST_ITEMS, rows)
+            # executemany no expone lastrowid; dentro de una única sentencia y
+            # transacción los rowid AUTOINCREMENT son contiguos
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            item_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+
+            # Relaciones de tags: un get_or_create por tag distinto, no por item
+            tag_ids = {}
+            item_tag_rows = []
+            for item_id, item_data in zip(item_ids, items_data):
+                names = {tag.strip().lower() for tag in item_data.get('tags') or [] if tag.strip()}
+                for name in names:
+                    if name not in tag_ids:
+                        tag_ids[name] = self.get_or_create_tag(name)
+                    item_tag_rows.append((item_id, tag_ids[name]))
+
+            if item_tag_rows:
+                conn.executemany(self._SQL_INSERT_ITEM_TAG, item_tag_rows)
+                usage = {}
+                for _, tag_id in item_tag_rows:
+                    usage[tag_id] = usage.get(tag_id, 0) + 1
+                conn.executemany(
+                    self._SQL_BUMP_TAG_USAGE,
+                    [(count, tag_id) for tag_id, count in usage.items()]
+                )
+
+        logger.info(f"Items added in bulk: {len(item_ids)} (Category: {category_id}, List: {list_id})")
+        return item_ids
+
     def update_item(self, item_id: int, **kwargs) -> None:
         """
         Update item fields
@@ -2180,6 +2352,23 @@ class DBManager:
         result = self.execute_query(query, (tag_id,))
         return result[0] if result else None
 
+    def get_tags_by_ids(self, tag_ids: List[int]) -> List[Dict]:
+        """
+        Get several tags by ID in a single query
+
+        Args:
+            tag_ids: List of tag IDs
+
+        Returns:
+            List[Dict]: Tag dictionaries, in the same order as tag_ids
+        """
+        if not tag_ids:
+            return []
+        placeholders = ','.join('?' * len(tag_ids))
+        query = f"SELECT * FROM tags WHERE id IN ({placeholders})"
+        rows = {row['id']: row for row in self.execute_query(query, tuple(tag_ids))}
+        return [rows[tag_id] for tag_id in tag_ids if tag_id in rows]
+
     def get_tag_by_name(self, tag_name: str) -> Optional[Dict]:
         """
         Get tag by name
@@ -2607,8 +2796,7 @@ class DBManager:
         Returns:
             Dict con datos de la lista o None si no existe
         """
-        query = "SELECT * FROM listas WHERE id = ?"
-        results = self.execute_query(query, (lista_id,))
+        results = self.execute_query(self._SQL_SELECT_LISTA, (lista_id,))
         return results[0] if results else None
 
     def get_lista_by_name(self, category_id: int, name: str) -> Optional[Dict[str, Any]]:
@@ -2750,14 +2938,7 @@ class DBManager:
         Returns:
             List[Dict]: Items de la lista ordenados
         """
-        query = '''
-            SELECT i.*, l.name as lista_name
-            FROM items i
-            JOIN listas l ON i.list_id = l.id
-            WHERE i.list_id = ?
-            ORDER BY i.orden_lista ASC
-        '''
-        results = self.execute_query(query, (lista_id,))
+        results = self.execute_query(self._SQL_SELECT_ITEMS_BY_LISTA, (lista_id,))
 
         # Descifrar contenido si es necesario
         for item in results:
@@ -2771,6 +2952,57 @@ class DBManager:
         logger.debug(f"Obtenidos {len(results)} items de lista {lista_id}")
         return results
 
+    def get_lista_concatenated_content(self, lista_id: int, separator: str = '\n') -> tuple[str, int]:
+        """
+        Obtiene el contenido de todos los items de una lista ya unido por SQL
+
+        Usa group_concat sobre los items ordenados por orden_lista, sin
+        materializar cada fila como dict. Si la lista tiene items sensibles se
+        recurre a get_items_by_lista() para descifrarlos.
+
+        Args:
+            lista_id: ID de la lista
+            separator: Separador entre contenidos
+
+        Returns:
+            Tuple (contenido_unido, número_de_items); ("", 0) si la lista está vacía
+        """
+        query = '''
+            SELECT group_concat(content, ?) AS combined, COUNT(*) AS total,
+                   MAX(is_sensitive) AS has_sensitive
+            FROM (SELECT content, is_sensitive FROM items WHERE list_id = ? ORDER BY orden_lista ASC)
+        '''
+        row = self.execute_query(query, (separator, lista_id))[0]
+
+        if row['has_sensitive']:
+            items = self.get_items_by_lista(lista_id)
+            return separator.join(item['content'] for item in items), len(items)
+
+        return row['combined'] or "", row['total']
+
+    def get_tags_by_lista(self, lista_id: int) -> Dict[int, List[str]]:
+        """
+        Obtiene los tags de todos los items de una lista en una sola consulta
+
+        Args:
+            lista_id: ID de la lista
+
+        Returns:
+            Dict[int, List[str]]: item_id -> nombres de tags (orden alfabético)
+        """
+        query = '''
+            SELECT it.item_id, t.name
+            FROM item_tags it
+            JOIN tags t ON it.tag_id = t.id
+            JOIN items i ON it.item_id = i.id
+            WHERE i.list_id = ?
+            ORDER BY t.name
+        '''
+        tags_by_item = {}
+        for row in self.execute_query(query, (lista_id,)):
+            tags_by_item.setdefault(row['item_id'], []).append(row['name'])
+        return tags_by_item
+
     # ========== LISTAS AVANZADAS (MÉTODOS LEGACY - mantener por compatibilidad) ==========
 
     def create_list(self, category_id: int, list_name: str, items_data: List[Dict[str, Any]]) -> List[int]:
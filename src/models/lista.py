@@ -14,6 +14,11 @@ class Lista:
     Esta clase reemplaza el sistema anterior basado en is_list/list_group.
     """
 
+    __slots__ = (
+        'id', 'category_id', 'name', 'description', 'created_at', 'updated_at',
+        'last_used', 'use_count', 'item_count', 'items'
+    )
+
     def __init__(
         self,
         lista_id: int,
@@ -42,8 +47,10 @@ class Lista:
         self.category_id = category_id
         self.name = name
         self.description = description
-        self.created_at = created_at or datetime.now().isoformat()
-        self.updated_at = updated_at or datetime.now().isoformat()
+        # Un solo datetime.now() y solo si falta algún timestamp (from_dict los trae de BD)
+        now = None if created_at and updated_at else datetime.now().isoformat()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
         self.last_used = last_used
         self.use_count = use_count
 
@@ -149,9 +156,8 @@ class Lista:
         return f"Lista(id={self.id}, name='{self.name}', category={self.category_id}, items={self.item_count})"
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, Lista):
-            return False
-        return self.id == other.id and self.category_id == other.category_id
+        # id es PK AUTOINCREMENT en la tabla listas: identifica la lista por sí solo
+        return isinstance(other, Lista) and self.id == other.id
 
     def __hash__(self) -> int:
-        return hash((self.id, self.category_id))
+        return hash(self.id)
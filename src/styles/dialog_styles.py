@@ -0,0 +1,140 @@
+"""
+Dialog Styles - Hojas de estilo (QSS) de los dialogs
+Cada hoja se construye una sola vez al importar el módulo y todos los
+dialogs la reutilizan, en lugar de rearmarla en cada apertura.
+"""
+
+
+# ==================== PALETA (TEMA OSCURO) ====================
+# Colores definidos en un solo lugar; las hojas se generan a partir de ellos
+
+BACKGROUND = '#1e1e1e'        # Fondo del dialog y campos de solo lectura
+SURFACE = '#2d2d2d'           # Fondo de campos editables
+SURFACE_HOVER = '#4d4d4d'     # Hover de botones secundarios
+BORDER = '#3d3d3d'            # Bordes y botones secundarios
+ACCENT = '#00d4ff'            # Acento (encabezados, foco, botón principal)
+ACCENT_HOVER = '#00b8d4'      # Hover del botón principal
+TEXT_PRIMARY = '#ffffff'      # Texto principal
+TEXT_MUTED = '#888888'        # Texto secundario / deshabilitado
+TEXT_ON_ACCENT = '#000000'    # Texto sobre el color de acento
+
+
+# ==================== SAVE URL DIALOG ====================
+# Hoja única aplicada a la raíz del dialog: Qt la parsea una vez y pule el árbol
+# en una sola pasada. Cada widget se identifica por su objectName.
+SAVE_URL_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {BACKGROUND};
+    }}
+    QLabel {{
+        color: {TEXT_PRIMARY};
+    }}
+
+    /* Encabezados de sección */
+    QLabel#sectionHeader {{
+        font-weight: bold;
+        color: {ACCENT};
+    }}
+    QLabel#sectionHeaderMuted, QToolButton#tagsToggle {{
+        font-weight: bold;
+        color: {TEXT_MUTED};
+    }}
+    QToolButton#tagsToggle {{
+        background: transparent;
+        border: none;
+        padding: 0;
+    }}
+    QToolButton#tagsToggle:hover {{
+        color: {ACCENT};
+    }}
+
+    /* URL (solo lectura) */
+    QLineEdit#urlDisplay {{
+        background-color: {BACKGROUND};
+        color: {TEXT_MUTED};
+        border: 1px solid {BORDER};
+        border-radius: 3px;
+        padding: 8px;
+        font-size: 10pt;
+    }}
+
+    /* Campos editables (nombre y tags de respaldo) */
+    QLineEdit#labelInput, QLineEdit#tagInput {{
+        background-color: {SURFACE};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER};
+        border-radius: 3px;
+        padding: 8px;
+        font-size: 10pt;
+    }}
+    QLineEdit#labelInput:focus, QLineEdit#tagInput:focus {{
+        border: 1px solid {ACCENT};
+    }}
+
+    /* Selector de categoría */
+    QComboBox#categoryCombo {{
+        background-color: {SURFACE};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER};
+        border-radius: 3px;
+        padding: 8px;
+        font-size: 10pt;
+    }}
+    QComboBox#categoryCombo:hover {{
+        border: 1px solid {ACCENT};
+    }}
+    QComboBox#categoryCombo::drop-down {{
+        border: none;
+    }}
+    QComboBox#categoryCombo QAbstractItemView {{
+        background-color: {SURFACE};
+        color: {TEXT_PRIMARY};
+        selection-background-color: {ACCENT};
+        selection-color: {TEXT_ON_ACCENT};
+    }}
+
+    /* Descripción */
+    QPlainTextEdit#descriptionInput {{
+        background-color: {SURFACE};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER};
+        border-radius: 3px;
+        padding: 8px;
+        font-size: 10pt;
+    }}
+    QPlainTextEdit#descriptionInput:focus {{
+        border: 1px solid {ACCENT};
+    }}
+
+    /* Botones */
+    QPushButton#cancelBtn {{
+        background-color: {BORDER};
+        color: {TEXT_PRIMARY};
+        border: none;
+        border-radius: 3px;
+        padding: 10px;
+        font-size: 10pt;
+    }}
+    QPushButton#cancelBtn:hover {{
+        background-color: {SURFACE_HOVER};
+    }}
+    QPushButton#saveBtn {{
+        background-color: {ACCENT};
+        color: {TEXT_ON_ACCENT};
+        border: none;
+        border-radius: 3px;
+        padding: 10px;
+        font-size: 10pt;
+        font-weight: bold;
+    }}
+    QPushButton#saveBtn:hover {{
+        background-color: {ACCENT_HOVER};
+    }}
+    QPushButton#saveBtn:disabled {{
+        background-color: {BORDER};
+        color: {TEXT_MUTED};
+    }}
+"""
+# Se compacta una vez al importar: Qt recibe (convierte y tokeniza) menos caracteres
+# en cada setStyleSheet, y el mismo objeto str se reutiliza en todas las aperturas
+SAVE_URL_DIALOG_QSS = " ".join(SAVE_URL_DIALOG_QSS.split())
@@ -98,7 +98,8 @@ def validate_html_syntax(html_content: str) -> Tuple[bool, List[str]]:
     Returns:
         Tupla de (es_válido, lista_de_errores)
     """
-    if not html_content.strip():
+    # isspace() evita copiar todo el documento como haría strip()
+    if not html_content or html_content.isspace():
         return False, ["El contenido HTML está vacío"]
 
     parser = HTMLSyntaxValidator()
@@ -223,12 +224,26 @@ def validate_web_static_content(html_content: str) -> dict:
             'can_save': bool            # True si puede guardarse (sintaxis válida + tamaño OK)
         }
     """
+    # Validación de tamaño (primero: si excede el hard limit no se puede guardar,
+    # así que no tiene sentido parsear ni escanear todo el contenido)
+    size_valid, size_level, size_message = validate_html_size(html_content)
+
+    if not size_valid:
+        return {
+            'is_valid': False,
+            'syntax_valid': True,
+            'syntax_errors': [],
+            'size_valid': False,
+            'size_level': size_level,
+            'size_message': size_message,
+            'security_safe': True,
+            'security_warnings': [],
+            'can_save': False
+        }
+
     # Validación de sintaxis
     syntax_valid, syntax_errors = validate_html_syntax(html_content)
 
-    # Validación de tamaño
-    size_valid, size_level, size_message = validate_html_size(html_content)
-
     # Escaneo de seguridad
     security_safe, security_warnings = scan_dangerous_patterns(html_content)
 
@@ -3,9 +3,10 @@ Wizard para crear items de tipo WEB_STATIC.
 Permite crear aplicaciones web estáticas con validación y seguridad.
 """
 
-import sys
-from pathlib import Path
+import re
+import html
 import logging
+from typing import List
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -15,15 +16,264 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from utils.html_validator import validate_web_static_content
 from utils.constants import ITEM_TYPE_ICONS
-from views.widgets.project_tag_selector import ProjectTagSelector
-from core.global_tag_manager import GlobalTagManager
 
 logger = logging.getLogger(__name__)
 
+# Los botones y sus slots viven en el hilo de la UI: conexión directa, sin consultar afinidad
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+# Texto del label de tipo (solo lectura) del paso 1
+_WEB_STATIC_TYPE_LABEL = f"{ITEM_TYPE_ICONS['WEB_STATIC']} WEB_STATIC"
+
+# ==================== ESTILOS (QSS) ====================
+# Se construyen una vez al importar el módulo y se reutilizan en cada apertura
+
+# Tema oscuro consistente con el proyecto
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 11pt;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border-color: #00d4ff;
+    }
+    QPushButton:pressed {
+        background-color: #1e1e1e;
+    }
+    QPushButton:disabled {
+        background-color: #2d2d2d;
+        color: #666666;
+        border-color: #3d3d3d;
+    }
+    QLineEdit, QPlainTextEdit, QTextEdit, QComboBox {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+    }
+    QLineEdit:focus, QPlainTextEdit:focus, QTextEdit:focus {
+        border-color: #00d4ff;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #ffffff;
+        margin-right: 5px;
+    }
+"""
+
+_STACK_QSS = """
+    QStackedWidget {
+        background-color: #252525;
+        border: none;
+    }
+"""
+
+_HEADER_QSS = """
+    QWidget {
+        background-color: #1e1e1e;
+        border-bottom: 2px solid #00d4ff;
+    }
+"""
+
+_NAV_QSS = """
+    QWidget {
+        background-color: #1e1e1e;
+        border-top: 1px solid #3d3d3d;
+    }
+"""
+
+_INTRO_QSS = (
+    "background-color: #2d2d2d; "
+    "padding: 15px; "
+    "border-radius: 6px; "
+    "border-left: 4px solid #00d4ff;"
+)
+
+_EDITOR_INFO_QSS = (
+    "background-color: #2d2d2d; "
+    "padding: 15px; "
+    "border-radius: 6px; "
+    "border-left: 4px solid #FFA726;"
+)
+
+_VALIDATION_OUTPUT_QSS = """
+    QTextEdit {
+        background-color: #1e1e1e;
+        border: 1px solid #00d4ff;
+    }
+"""
+
+# Botón principal (Siguiente / Validar HTML)
+_PRIMARY_BTN_QSS = """
+    QPushButton {
+        background-color: #00d4ff;
+        color: #000000;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #00b8e6;
+    }
+    QPushButton:disabled {
+        background-color: #2d2d2d;
+        color: #666666;
+    }
+"""
+
+_CREATE_BTN_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #2d2d2d;
+        color: #666666;
+    }
+"""
+
+# ==================== PLANTILLAS HTML DE RESULTADOS ====================
+
+_RESULT_HEADER_HTML = (
+    "<div style='padding: 10px;'>"
+    "<h3 style='color: #00d4ff; margin-top: 0;'>Resultados de Validación</h3>"
+)
+_RESULT_OK_P = "<p style='color: #4CAF50; margin: 5px 0;'>✓ <b>{}:</b> {}</p>"
+_RESULT_WARN_P = "<p style='color: #FFA726; margin: 5px 0;'>⚠ <b>{}:</b> {}</p>"
+_RESULT_ERR_P = "<p style='color: #f44336; margin: 5px 0;'>✗ <b>{}:</b> {}</p>"
+_RESULT_SKIPPED_P = "<p style='color: #888888; margin: 5px 0;'>– <b>{}:</b> {}</p>"
+_RESULT_SKIPPED_MSG = "No verificado (excede 500 KB)"
+_RESULT_UL_OPEN = "<ul style='margin: 5px 0; padding-left: 20px;'>"
+_ERR_LI_TEMPLATE = "<li style='color: #f44336;'>{}</li>"
+_WARN_LI_TEMPLATE = "<li style='color: #FFA726;'>{}</li>"
+
+# Barra de estado del validador
+_STATUS_IDLE_QSS = (
+    "padding: 8px; "
+    "background-color: #2d2d2d; "
+    "border-radius: 4px; "
+    "font-weight: bold;"
+)
+
+_STATUS_OK_QSS = (
+    "padding: 8px; "
+    "background-color: #4CAF50; "
+    "color: #000000; "
+    "border-radius: 4px; "
+    "font-weight: bold;"
+)
+
+_STATUS_WARN_QSS = (
+    "padding: 8px; "
+    "background-color: #FFA726; "
+    "color: #000000; "
+    "border-radius: 4px; "
+    "font-weight: bold;"
+)
+
+_STATUS_ERR_QSS = (
+    "padding: 8px; "
+    "background-color: #f44336; "
+    "color: #ffffff; "
+    "border-radius: 4px; "
+    "font-weight: bold;"
+)
+
+# Estado de validación -> (QSS, texto) de la barra de estado
+_STATUS_STYLES = {
+    'valid': (_STATUS_OK_QSS, "✓ Estado: Válido - Listo para guardar"),
+    'warn': (_STATUS_WARN_QSS, "⚠ Estado: Advertencias - Puede guardarse"),
+    'error': (_STATUS_ERR_QSS, "✗ Estado: Errores - No se puede guardar"),
+}
+
+# Tags separados por coma, ya recortados y sin entradas vacías
+_TAG_SPLIT_RE = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
+
+# ==================== FUENTES ====================
+# Se crean al primer uso (QFont requiere QApplication) y se comparten entre aperturas
+_CONSOLAS_10 = None
+_TITLE_FONT = None
+
+
+def _consolas_10() -> QFont:
+    """Fuente monoespaciada del editor HTML"""
+    global _CONSOLAS_10
+    if _CONSOLAS_10 is None:
+        _CONSOLAS_10 = QFont("Consolas", 10)
+    return _CONSOLAS_10
+
+
+def _title_font() -> QFont:
+    """Fuente en negrita del título del header"""
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        font = QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        _TITLE_FONT = font
+    return _TITLE_FONT
+
+
+class _LazyComboBox(QComboBox):
+    """QComboBox que carga sus opciones en la primera interacción (foco, teclado, rueda o desplegable)"""
+
+    def __init__(self, loader, parent=None):
+        """
+        Args:
+            loader: Callable sin argumentos que llena el combo
+            parent: Widget padre
+        """
+        super().__init__(parent)
+        self._loader = loader
+        self._loaded = False
+
+    def ensure_loaded(self):
+        """Ejecuta el loader una sola vez y selecciona la primera opción"""
+        if not self._loaded:
+            self._loaded = True
+            self._loader()
+            # Con placeholder Qt no auto-selecciona el primer elemento insertado
+            if self.currentIndex() < 0 and self.count():
+                self.setCurrentIndex(0)
+
+    def showPopup(self):
+        self.ensure_loaded()
+        super().showPopup()
+
+    def focusInEvent(self, event):
+        self.ensure_loaded()
+        super().focusInEvent(event)
+
+    def keyPressEvent(self, event):
+        self.ensure_loaded()
+        super().keyPressEvent(event)
+
+    def wheelEvent(self, event):
+        self.ensure_loaded()
+        super().wheelEvent(event)
+
 
 class CreateWebStaticItemWizard(QDialog):
     """Wizard para crear items WEB_STATIC en 2 pasos"""
@@ -42,10 +292,13 @@ class CreateWebStaticItemWizard(QDialog):
         self.controller = controller
         self.current_step = 0
         self.total_steps = 2
+        self._last_validation = None  # (html_content, result) de la última validación
+        self._message_boxes = {}  # título -> QMessageBox reutilizable, se crean al primer uso
 
         # Initialize GlobalTagManager
         self.global_tag_manager = None
         try:
+            from core.global_tag_manager import GlobalTagManager
             self.global_tag_manager = GlobalTagManager(controller.config_manager.db)
         except Exception as e:
             logger.error(f"Could not initialize GlobalTagManager: {e}")
@@ -62,55 +315,7 @@ class CreateWebStaticItemWizard(QDialog):
     def _init_ui(self):
         """Inicializa la interfaz del wizard"""
         # Aplicar tema oscuro consistente con el proyecto
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #00d4ff;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-                border-color: #3d3d3d;
-            }
-            QLineEdit, QPlainTextEdit, QTextEdit, QComboBox {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-            }
-            QLineEdit:focus, QPlainTextEdit:focus, QTextEdit:focus {
-                border-color: #00d4ff;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(0)
@@ -122,21 +327,15 @@ class CreateWebStaticItemWizard(QDialog):
 
         # Stacked widget para los pasos
         self.stack = QStackedWidget()
-        self.stack.setStyleSheet("""
-            QStackedWidget {
-                background-color: #252525;
-                border: none;
-            }
-        """)
+        self.stack.setStyleSheet(_STACK_QSS)
         layout.addWidget(self.stack)
 
         # Paso 1: Configuración básica
         self.step1_widget = self._create_step1()
         self.stack.addWidget(self.step1_widget)
 
-        # Paso 2: Editor de código
-        self.step2_widget = self._create_step2()
-        self.stack.addWidget(self.step2_widget)
+        # Paso 2: Editor de código (se construye al avanzar por primera vez)
+        self.step2_widget = None
 
         # Barra de navegación
         nav_bar = self._create_navigation_bar()
@@ -145,12 +344,7 @@ class CreateWebStaticItemWizard(QDialog):
     def _create_header(self) -> QWidget:
         """Crea el header con título y progreso"""
         header_widget = QWidget()
-        header_widget.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                border-bottom: 2px solid #00d4ff;
-            }
-        """)
+        header_widget.setStyleSheet(_HEADER_QSS)
         header_widget.setFixedHeight(80)
 
         header_layout = QVBoxLayout(header_widget)
@@ -158,10 +352,7 @@ class CreateWebStaticItemWizard(QDialog):
 
         # Título
         title = QLabel("🌐 Crear Item Web Estático")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_title_font())
         title.setStyleSheet("color: #00d4ff;")
         header_layout.addWidget(title)
 
@@ -186,12 +377,7 @@ class CreateWebStaticItemWizard(QDialog):
             "timers o cualquier herramienta HTML/CSS/JS."
         )
         intro_label.setWordWrap(True)
-        intro_label.setStyleSheet(
-            "background-color: #2d2d2d; "
-            "padding: 15px; "
-            "border-radius: 6px; "
-            "border-left: 4px solid #00d4ff;"
-        )
+        intro_label.setStyleSheet(_INTRO_QSS)
         layout.addWidget(intro_label)
 
         # Formulario
@@ -206,10 +392,10 @@ class CreateWebStaticItemWizard(QDialog):
         self.label_input.setMinimumHeight(35)
         form_layout.addRow("Nombre del Item: *", self.label_input)
 
-        # Categoría
-        self.category_combo = QComboBox()
+        # Categoría (se consulta la BD al abrir el desplegable, no al abrir el wizard)
+        self.category_combo = _LazyComboBox(self._load_categories)
         self.category_combo.setMinimumHeight(35)
-        self._load_categories()
+        self.category_combo.setPlaceholderText("Seleccione una categoría...")
         form_layout.addRow("Categoría: *", self.category_combo)
 
         # Tags con ProjectTagSelector
@@ -217,18 +403,21 @@ class CreateWebStaticItemWizard(QDialog):
         form_layout.addRow(tags_label)
 
         if self.global_tag_manager:
+            from views.widgets.project_tag_selector import ProjectTagSelector
             self.tag_selector = ProjectTagSelector(self.global_tag_manager)
             self.tag_selector.setMinimumHeight(150)
             form_layout.addRow(self.tag_selector)
+            self._get_tags = self._tags_from_selector
         else:
             # Fallback if no manager available
             self.tag_selector = QLineEdit()
             self.tag_selector.setPlaceholderText("tag1, tag2, tag3 (separados por coma)")
             self.tag_selector.setMinimumHeight(35)
             form_layout.addRow(self.tag_selector)
+            self._get_tags = self._tags_from_line_edit
 
         # Tipo (readonly)
-        type_label = QLabel(f"{ITEM_TYPE_ICONS['WEB_STATIC']} WEB_STATIC")
+        type_label = QLabel(_WEB_STATIC_TYPE_LABEL)
         type_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 11pt;")
         form_layout.addRow("Tipo:", type_label)
 
@@ -257,12 +446,7 @@ class CreateWebStaticItemWizard(QDialog):
             "⚠️ Límites: 100 KB recomendado, 500 KB máximo"
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet(
-            "background-color: #2d2d2d; "
-            "padding: 15px; "
-            "border-radius: 6px; "
-            "border-left: 4px solid #FFA726;"
-        )
+        info_label.setStyleSheet(_EDITOR_INFO_QSS)
         layout.addWidget(info_label)
 
         # Editor de código
@@ -293,34 +477,21 @@ class CreateWebStaticItemWizard(QDialog):
             "</body>\n"
             "</html>"
         )
-        self.html_editor.setFont(QFont("Consolas", 10))
+        self.html_editor.setFont(_consolas_10())
         self.html_editor.setMinimumHeight(300)
+        self.html_editor.textChanged.connect(self._invalidate_validation)
         layout.addWidget(self.html_editor, stretch=1)
 
         # Barra de estado del validador
         self.validation_status = QLabel("⚪ Estado: Sin validar")
-        self.validation_status.setStyleSheet(
-            "padding: 8px; "
-            "background-color: #2d2d2d; "
-            "border-radius: 4px; "
-            "font-weight: bold;"
-        )
+        self.validation_status.setStyleSheet(_STATUS_IDLE_QSS)
         layout.addWidget(self.validation_status)
 
         # Botón de validación
         validate_btn = QPushButton("🔍 Validar HTML")
-        validate_btn.clicked.connect(self._validate_html)
+        validate_btn.clicked.connect(self._validate_html, _DIRECT)
         validate_btn.setMinimumHeight(40)
-        validate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00d4ff;
-                color: #000000;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00b8e6;
-            }
-        """)
+        validate_btn.setStyleSheet(_PRIMARY_BTN_QSS)
         layout.addWidget(validate_btn)
 
         # Área de resultados de validación (oculta por defecto)
@@ -328,12 +499,7 @@ class CreateWebStaticItemWizard(QDialog):
         self.validation_output.setReadOnly(True)
         self.validation_output.setMaximumHeight(150)
         self.validation_output.setVisible(False)
-        self.validation_output.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                border: 1px solid #00d4ff;
-            }
-        """)
+        self.validation_output.setStyleSheet(_VALIDATION_OUTPUT_QSS)
         layout.addWidget(self.validation_output)
 
         return widget
@@ -351,12 +517,7 @@ class CreateWebStaticItemWizard(QDialog):
     def _create_navigation_bar(self) -> QWidget:
         """Crea la barra de navegación con botones"""
         nav_widget = QWidget()
-        nav_widget.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                border-top: 1px solid #3d3d3d;
-            }
-        """)
+        nav_widget.setStyleSheet(_NAV_QSS)
         nav_widget.setFixedHeight(70)
 
         nav_layout = QHBoxLayout(nav_widget)
@@ -364,7 +525,7 @@ class CreateWebStaticItemWizard(QDialog):
 
         # Botón Atrás
         self.back_btn = QPushButton("← Atrás")
-        self.back_btn.clicked.connect(self._go_back)
+        self.back_btn.clicked.connect(self._go_back, _DIRECT)
         self.back_btn.setMinimumWidth(120)
         self.back_btn.setMinimumHeight(40)
         nav_layout.addWidget(self.back_btn)
@@ -373,52 +534,26 @@ class CreateWebStaticItemWizard(QDialog):
 
         # Botón Cancelar
         self.cancel_btn = QPushButton("Cancelar")
-        self.cancel_btn.clicked.connect(self.reject)
+        self.cancel_btn.clicked.connect(self.reject, _DIRECT)
         self.cancel_btn.setMinimumWidth(120)
         self.cancel_btn.setMinimumHeight(40)
         nav_layout.addWidget(self.cancel_btn)
 
         # Botón Siguiente
         self.next_btn = QPushButton("Siguiente →")
-        self.next_btn.clicked.connect(self._go_next)
+        self.next_btn.clicked.connect(self._go_next, _DIRECT)
         self.next_btn.setMinimumWidth(120)
         self.next_btn.setMinimumHeight(40)
-        self.next_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00d4ff;
-                color: #000000;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00b8e6;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
+        self.next_btn.setStyleSheet(_PRIMARY_BTN_QSS)
         nav_layout.addWidget(self.next_btn)
 
         # Botón Crear
         self.create_btn = QPushButton("✓ Crear Item")
-        self.create_btn.clicked.connect(self._create_item)
+        self.create_btn.clicked.connect(self._create_item, _DIRECT)
         self.create_btn.setMinimumWidth(140)
         self.create_btn.setMinimumHeight(40)
         self.create_btn.setVisible(False)
-        self.create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666666;
-            }
-        """)
+        self.create_btn.setStyleSheet(_CREATE_BTN_QSS)
         nav_layout.addWidget(self.create_btn)
 
         return nav_widget
@@ -453,11 +588,35 @@ class CreateWebStaticItemWizard(QDialog):
                 )
                 return
 
+            if not self._require_category():
+                return
+
+            # Construir paso 2 la primera vez que se necesita
+            if self.step2_widget is None:
+                self.step2_widget = self._create_step2()
+                self.stack.addWidget(self.step2_widget)
+
             # Avanzar a paso 2
             self.current_step = 1
             self._update_ui_state()
             logger.info("Avanzado a paso 2 (editor HTML)")
 
+    def _require_category(self) -> bool:
+        """
+        Verifica que el usuario haya elegido una categoría en el combo
+
+        Returns:
+            True si hay categoría seleccionada; si no, muestra un aviso y retorna False
+        """
+        if self.category_combo.currentIndex() < 0:
+            QMessageBox.warning(
+                self,
+                "Campo Requerido",
+                "Seleccione una categoría."
+            )
+            return False
+        return True
+
     def _go_back(self):
         """Retrocede al paso anterior"""
         if self.current_step == 1:
@@ -465,112 +624,194 @@ class CreateWebStaticItemWizard(QDialog):
             self._update_ui_state()
             logger.info("Retrocedido a paso 1 (configuración)")
 
+    def _message_box(self, title: str, icon, buttons=QMessageBox.StandardButton.Ok,
+                     default_button=None) -> QMessageBox:
+        """
+        Obtiene un QMessageBox reutilizable (se crea una sola vez por título)
+
+        Args:
+            title: Título de la ventana, identifica al diálogo
+            icon: QMessageBox.Icon a mostrar
+            buttons: Botones estándar del diálogo
+            default_button: Botón por defecto (opcional)
+
+        Returns:
+            QMessageBox listo para asignarle texto y ejecutar
+        """
+        box = self._message_boxes.get(title)
+        if box is None:
+            box = QMessageBox(icon, title, "", buttons, self)
+            if default_button is not None:
+                box.setDefaultButton(default_button)
+            self._message_boxes[title] = box
+        return box
+
+    def _empty_warning(self, message: str):
+        """
+        Muestra el aviso de editor vacío
+
+        Args:
+            message: Texto del aviso
+        """
+        box = self._message_box("Campo Vacío", QMessageBox.Icon.Warning)
+        box.setText(message)
+        box.exec()
+
+    def _error_box(self, message: str):
+        """
+        Muestra el error de validación que impide guardar
+
+        Args:
+            message: Texto del error
+        """
+        box = self._message_box("Error de Validación", QMessageBox.Icon.Critical)
+        box.setText(message)
+        box.exec()
+
+    def _confirm_box(self, message: str) -> bool:
+        """
+        Pide confirmación para guardar pese a las advertencias
+
+        Args:
+            message: Texto de la pregunta
+
+        Returns:
+            True si el usuario eligió "Sí"
+        """
+        box = self._message_box(
+            "Advertencias Detectadas",
+            QMessageBox.Icon.Question,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        box.setText(message)
+        return box.exec() == QMessageBox.StandardButton.Yes
+
+    def _editor_html(self) -> str:
+        """
+        Obtiene el HTML del editor sin copiar el buffer si el documento está vacío
+
+        Returns:
+            Contenido del editor ('' si está vacío)
+        """
+        if self.html_editor.document().isEmpty():
+            return ""
+        return self.html_editor.toPlainText()
+
+    def _validated(self, html_content: str) -> dict:
+        """
+        Valida el HTML reutilizando el último resultado si el contenido no cambió
+
+        Args:
+            html_content: Contenido HTML a validar
+
+        Returns:
+            Diccionario de resultados de validate_web_static_content
+        """
+        if self._last_validation and self._last_validation[0] == html_content:
+            return self._last_validation[1]
+
+        result = validate_web_static_content(html_content)
+        self._last_validation = (html_content, result)
+        return result
+
+    def _tags_from_selector(self) -> List[str]:
+        """Nombres de los tags marcados en el ProjectTagSelector"""
+        selected_ids = self.tag_selector.get_selected_tags()
+        return [tag.name for tag in self.global_tag_manager.get_tags(selected_ids)]
+
+    def _tags_from_line_edit(self) -> List[str]:
+        """Tags escritos en el QLineEdit de respaldo, separados por coma"""
+        return _TAG_SPLIT_RE.findall(self.tag_selector.text())
+
+    def _invalidate_validation(self):
+        """Descarta el resultado de validación cacheado (el HTML fue editado)"""
+        self._last_validation = None
+
     def _validate_html(self):
         """Valida el contenido HTML ingresado"""
-        html_content = self.html_editor.toPlainText()
+        html_content = self._editor_html()
 
-        if not html_content.strip():
-            QMessageBox.warning(
-                self,
-                "Campo Vacío",
-                "Ingrese código HTML para validar."
-            )
+        if not html_content or html_content.isspace():
+            self._empty_warning("Ingrese código HTML para validar.")
             return
 
         # Ejecutar validación completa
-        result = validate_web_static_content(html_content)
+        result = self._validated(html_content)
 
-        # Mostrar resultados
+        # Mostrar resultados (se arma como lista de fragmentos y se une una sola vez)
         self.validation_output.setVisible(True)
-        output_html = "<div style='padding: 10px;'>"
-        output_html += "<h3 style='color: #00d4ff; margin-top: 0;'>Resultados de Validación</h3>"
+        parts = [_RESULT_HEADER_HTML]
+
+        # Sobre el límite de tamaño el validador no analiza sintaxis ni seguridad
+        checked = result['size_valid']
 
         # Sintaxis
-        if result['syntax_valid']:
-            output_html += "<p style='color: #4CAF50; margin: 5px 0;'>✓ <b>Sintaxis HTML:</b> Válida</p>"
+        if not checked:
+            parts.append(_RESULT_SKIPPED_P.format("Sintaxis HTML", _RESULT_SKIPPED_MSG))
+        elif result['syntax_valid']:
+            parts.append(_RESULT_OK_P.format("Sintaxis HTML", "Válida"))
         else:
-            output_html += "<p style='color: #f44336; margin: 5px 0;'>✗ <b>Sintaxis HTML:</b> Errores encontrados</p>"
-            output_html += "<ul style='margin: 5px 0; padding-left: 20px;'>"
-            for error in result['syntax_errors']:
-                output_html += f"<li style='color: #f44336;'>{error}</li>"
-            output_html += "</ul>"
+            parts.append(_RESULT_ERR_P.format("Sintaxis HTML", "Errores encontrados"))
+            parts.append(_RESULT_UL_OPEN)
+            parts.append("".join(_ERR_LI_TEMPLATE.format(html.escape(error))
+                                 for error in result['syntax_errors']))
+            parts.append("</ul>")
 
         # Tamaño
+        size_message = html.escape(result['size_message'])
         if result['size_level'] == 'ok':
-            output_html += f"<p style='color: #4CAF50; margin: 5px 0;'>✓ <b>Tamaño:</b> {result['size_message']}</p>"
+            parts.append(_RESULT_OK_P.format("Tamaño", size_message))
         elif result['size_level'] == 'warning':
-            output_html += f"<p style='color: #FFA726; margin: 5px 0;'>⚠ <b>Tamaño:</b> {result['size_message']}</p>"
+            parts.append(_RESULT_WARN_P.format("Tamaño", size_message))
         else:
-            output_html += f"<p style='color: #f44336; margin: 5px 0;'>✗ <b>Tamaño:</b> {result['size_message']}</p>"
+            parts.append(_RESULT_ERR_P.format("Tamaño", size_message))
 
         # Seguridad
-        if result['security_safe']:
-            output_html += "<p style='color: #4CAF50; margin: 5px 0;'>✓ <b>Seguridad:</b> Sin patrones sospechosos</p>"
+        if not checked:
+            parts.append(_RESULT_SKIPPED_P.format("Seguridad", _RESULT_SKIPPED_MSG))
+        elif result['security_safe']:
+            parts.append(_RESULT_OK_P.format("Seguridad", "Sin patrones sospechosos"))
         else:
-            output_html += "<p style='color: #FFA726; margin: 5px 0;'>⚠ <b>Seguridad:</b> Patrones sospechosos detectados</p>"
-            output_html += "<ul style='margin: 5px 0; padding-left: 20px;'>"
-            for warning in result['security_warnings']:
-                output_html += f"<li style='color: #FFA726;'>{warning}</li>"
-            output_html += "</ul>"
+            parts.append(_RESULT_WARN_P.format("Seguridad", "Patrones sospechosos detectados"))
+            parts.append(_RESULT_UL_OPEN)
+            parts.append("".join(_WARN_LI_TEMPLATE.format(html.escape(warning))
+                                 for warning in result['security_warnings']))
+            parts.append("</ul>")
 
-        output_html += "</div>"
-        self.validation_output.setHtml(output_html)
+        parts.append("</div>")
+        self.validation_output.setHtml("".join(parts))
 
         # Actualizar estado
-        if result['can_save']:
-            if result['is_valid']:
-                self.validation_status.setText("✓ Estado: Válido - Listo para guardar")
-                self.validation_status.setStyleSheet(
-                    "padding: 8px; "
-                    "background-color: #4CAF50; "
-                    "color: #000000; "
-                    "border-radius: 4px; "
-                    "font-weight: bold;"
-                )
-            else:
-                self.validation_status.setText("⚠ Estado: Advertencias - Puede guardarse")
-                self.validation_status.setStyleSheet(
-                    "padding: 8px; "
-                    "background-color: #FFA726; "
-                    "color: #000000; "
-                    "border-radius: 4px; "
-                    "font-weight: bold;"
-                )
+        if not result['can_save']:
+            state = 'error'
         else:
-            self.validation_status.setText("✗ Estado: Errores - No se puede guardar")
-            self.validation_status.setStyleSheet(
-                "padding: 8px; "
-                "background-color: #f44336; "
-                "color: #ffffff; "
-                "border-radius: 4px; "
-                "font-weight: bold;"
-            )
+            state = 'valid' if result['is_valid'] else 'warn'
+        qss, text = _STATUS_STYLES[state]
+        self.validation_status.setText(text)
+        # Re-aplicar el QSS fuerza un re-pulido del label; solo si cambió el estado
+        if self.validation_status.styleSheet() != qss:
+            self.validation_status.setStyleSheet(qss)
 
         logger.info(f"HTML validado: can_save={result['can_save']}, is_valid={result['is_valid']}")
 
     def _create_item(self):
         """Crea el item WEB_STATIC"""
-        html_content = self.html_editor.toPlainText()
+        html_content = self._editor_html()
 
-        if not html_content.strip():
-            QMessageBox.warning(
-                self,
-                "Campo Vacío",
-                "Ingrese código HTML para crear el item."
-            )
+        if not html_content or html_content.isspace():
+            self._empty_warning("Ingrese código HTML para crear el item.")
             return
 
-        # Validar antes de guardar
-        result = validate_web_static_content(html_content)
+        # Validar antes de guardar (reutiliza el resultado si ya se validó este HTML)
+        result = self._validated(html_content)
 
         if not result['can_save']:
             error_msg = "El HTML contiene errores que impiden guardarlo:\n\n"
+            if not result['size_valid']:
+                error_msg += result['size_message']
             error_msg += "\n".join(result['syntax_errors'])
-            QMessageBox.critical(
-                self,
-                "Error de Validación",
-                error_msg
-            )
+            self._error_box(error_msg)
             return
 
         # Confirmar si hay warnings
@@ -585,35 +826,20 @@ class CreateWebStaticItemWizard(QDialog):
                 for warning in result['security_warnings'][:3]:  # Mostrar solo 3
                     warnings_text += f"  - {warning}\n"
 
-            reply = QMessageBox.question(
-                self,
-                "Advertencias Detectadas",
-                f"Se detectaron las siguientes advertencias:\n\n{warnings_text}\n¿Desea continuar de todas formas?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-
-            if reply != QMessageBox.StandardButton.Yes:
+            if not self._confirm_box(
+                f"Se detectaron las siguientes advertencias:\n\n{warnings_text}\n¿Desea continuar de todas formas?"
+            ):
                 return
 
         # Crear item
+        if not self._require_category():
+            return
         category_id = self.category_combo.currentData()
         label = self.label_input.text().strip()
         description = self.description_input.text().strip()
 
-        # Obtener tags
-        tags = []
-        if self.tag_selector and hasattr(self.tag_selector, 'get_selected_tags'):
-            # ProjectTagSelector
-            selected_ids = self.tag_selector.get_selected_tags()
-            for tag_id in selected_ids:
-                tag = self.global_tag_manager.get_tag(tag_id)
-                if tag:
-                    tags.append(tag.name)
-        elif hasattr(self, 'tag_selector'):
-            # QLineEdit fallback
-            tags_text = self.tag_selector.text().strip()
-            tags = [tag.strip() for tag in tags_text.split(',') if tag.strip()] if tags_text else []
+        # Obtener tags (extractor fijado en _create_step1 según el widget)
+        tags = self._get_tags()
 
         try:
             # Crear item en base de datos (tags se pasan directamente como parámetro)
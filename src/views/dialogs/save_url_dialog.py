@@ -2,21 +2,63 @@
 Save URL Dialog - Dialog para guardar la URL actual del navegador como item
 """
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QTextEdit, QComboBox, QPushButton, QMessageBox, QScrollArea
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QWidget, QToolButton,
+    QLineEdit, QPlainTextEdit, QComboBox, QPushButton, QMessageBox, QScrollArea
 )
-from PyQt6.QtCore import Qt
-import sys
-from pathlib import Path
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
 import logging
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from views.widgets.project_tag_selector import ProjectTagSelector
-from core.global_tag_manager import GlobalTagManager
-from database.db_manager import DBManager
+from styles.dialog_styles import SAVE_URL_DIALOG_QSS
 
 logger = logging.getLogger(__name__)
 
+# Espera tras la última pulsación antes de validar en vivo (ms)
+_LIVE_VALIDATE_DELAY_MS = 150
+
+
+@dataclass(slots=True, frozen=True)
+class SaveUrlPayload:
+    """
+    Datos del item URL confirmados en SaveUrlDialog.
+
+    Atributos:
+        category_id: ID de la categoría destino
+        label: Nombre del item
+        content: URL a guardar
+        description: Descripción opcional
+        tags: Nombres de los tags seleccionados
+        type: Tipo de item (siempre 'URL')
+    """
+    category_id: int
+    label: str
+    content: str
+    description: Optional[str]
+    tags: List[str]
+    type: str = 'URL'
+
+
+@lru_cache(maxsize=4)
+def _get_global_tag_manager(db_path: str):
+    """
+    Obtiene el GlobalTagManager de una base de datos, compartido entre aperturas.
+
+    Se conserva la misma conexión DBManager (y su caché de sentencias) en lugar
+    de abrir la base de datos cada vez que se muestra el dialog. Si la creación
+    falla la excepción no se cachea y se reintenta en la siguiente apertura.
+
+    Args:
+        db_path: Path a la base de datos
+
+    Returns:
+        GlobalTagManager asociado a db_path
+    """
+    from database.db_manager import DBManager
+    from core.global_tag_manager import GlobalTagManager
+    return GlobalTagManager(DBManager(db_path))
+
 
 class SaveUrlDialog(QDialog):
     """
@@ -29,6 +71,8 @@ class SaveUrlDialog(QDialog):
     - Tags (opcional)
     """
 
+    saved = pyqtSignal(object)  # SaveUrlPayload (get_data) al confirmar con "Guardar"
+
     def __init__(self, current_url: str, page_title: str, categories: list, db_path: str = None, parent=None):
         """
         Inicializa el dialog.
@@ -43,6 +87,8 @@ class SaveUrlDialog(QDialog):
         super().__init__(parent)
         self.current_url = current_url
         self.page_title = page_title
+        # Label sugerido: primeros 50 caracteres del título de la página
+        self._auto_label = page_title[:50] if page_title else "Nueva URL"
         self.categories = categories
         self.db_path = db_path
         self.selected_category_id = None
@@ -51,8 +97,7 @@ class SaveUrlDialog(QDialog):
         self.global_tag_manager = None
         if self.db_path:
             try:
-                db = DBManager(self.db_path)
-                self.global_tag_manager = GlobalTagManager(db)
+                self.global_tag_manager = _get_global_tag_manager(self.db_path)
             except Exception as e:
                 logger.error(f"Could not initialize GlobalTagManager: {e}")
 
@@ -70,136 +115,71 @@ class SaveUrlDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
 
         # === URL (solo lectura) ===
-        url_label = QLabel("URL:")
-        url_label.setStyleSheet("font-weight: bold; color: #00d4ff;")
-        layout.addWidget(url_label)
+        layout.addWidget(self._make_header("URL:"))
 
         self.url_display = QLineEdit()
         self.url_display.setText(self.current_url)
         self.url_display.setReadOnly(True)
-        self.url_display.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                color: #888888;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-        """)
+        self.url_display.setObjectName("urlDisplay")
         layout.addWidget(self.url_display)
 
         # === Categoría ===
-        category_label = QLabel("Categoría: *")
-        category_label.setStyleSheet("font-weight: bold; color: #00d4ff;")
-        layout.addWidget(category_label)
+        layout.addWidget(self._make_header("Categoría: *"))
 
         self.category_combo = QComboBox()
-        self.category_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-            QComboBox:hover {
-                border: 1px solid #00d4ff;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                selection-background-color: #00d4ff;
-                selection-color: #000000;
-            }
-        """)
-
-        # Agregar categorías al combo
-        for category in self.categories:
-            display_text = f"{category.icon} {category.name}" if hasattr(category, 'icon') else category.name
-            self.category_combo.addItem(display_text, category.id)
+        self.category_combo.setObjectName("categoryCombo")
+
+        self._populate_categories()
 
         layout.addWidget(self.category_combo)
 
         # === Label (auto-completado con título) ===
-        label_label = QLabel("Nombre del Item: *")
-        label_label.setStyleSheet("font-weight: bold; color: #00d4ff;")
-        layout.addWidget(label_label)
+        layout.addWidget(self._make_header("Nombre del Item: *"))
 
         self.label_input = QLineEdit()
-        # Auto-completar con título de página (primeros 50 chars)
-        auto_label = self.page_title[:50] if self.page_title else "Nueva URL"
-        self.label_input.setText(auto_label)
+        # Auto-completar con título de página
+        self.label_input.setText(self._auto_label)
         self.label_input.setPlaceholderText("Ej: Documentación React")
-        self.label_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border: 1px solid #00d4ff;
-            }
-        """)
+        self.label_input.setObjectName("labelInput")
         layout.addWidget(self.label_input)
 
         # === Descripción (opcional) ===
-        desc_label = QLabel("Descripción: (opcional)")
-        desc_label.setStyleSheet("font-weight: bold; color: #888888;")
-        layout.addWidget(desc_label)
+        layout.addWidget(self._make_header("Descripción: (opcional)", muted=True))
 
-        self.description_input = QTextEdit()
+        self.description_input = QPlainTextEdit()
         self.description_input.setPlaceholderText("Agrega una descripción opcional...")
         self.description_input.setMaximumHeight(80)
-        self.description_input.setStyleSheet("""
-            QTextEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-            QTextEdit:focus {
-                border: 1px solid #00d4ff;
-            }
-        """)
+        self.description_input.setObjectName("descriptionInput")
         layout.addWidget(self.description_input)
 
         # === Tags con ProjectTagSelector ===
-        tags_label = QLabel("Tags:")
-        tags_label.setStyleSheet("font-weight: bold; color: #888888;")
-        layout.addWidget(tags_label)
-
         if self.global_tag_manager:
-            self.tag_selector = ProjectTagSelector(self.global_tag_manager)
-            self.tag_selector.setMinimumHeight(150)
-            layout.addWidget(self.tag_selector)
+            # Sección plegable: el selector (que consulta la BD) se crea al expandirla
+            self.tag_selector = None
+            self._collect_tags = self._collect_tags_project
+            self._clear_tags = self._clear_tags_project
+            self._tag_toggle = QToolButton()
+            self._tag_toggle.setObjectName("tagsToggle")
+            self._tag_toggle.setText("Tags ▸")
+            self._tag_toggle.setCheckable(True)
+            self._tag_toggle.toggled.connect(self._ensure_tag_selector)
+            layout.addWidget(self._tag_toggle)
+
+            self._tags_container = QWidget()
+            tags_container_layout = QVBoxLayout(self._tags_container)
+            tags_container_layout.setContentsMargins(0, 0, 0, 0)
+            self._tags_container.setVisible(False)
+            layout.addWidget(self._tags_container)
         else:
+            layout.addWidget(self._make_header("Tags:", muted=True))
+
             # Fallback if no manager available
             self.tag_selector = QLineEdit()
             self.tag_selector.setPlaceholderText("tag1, tag2, tag3 (separados por comas)")
-            self.tag_selector.setStyleSheet("""
-                QLineEdit {
-                    background-color: #2d2d2d;
-                    color: #ffffff;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 3px;
-                    padding: 8px;
-                    font-size: 10pt;
-                }
-                QLineEdit:focus {
-                    border: 1px solid #00d4ff;
-                }
-            """)
+            self.tag_selector.setObjectName("tagInput")
             layout.addWidget(self.tag_selector)
+            self._collect_tags = self._collect_tags_csv
+            self._clear_tags = self._clear_tags_csv
 
         # === Botones ===
         buttons_layout = QHBoxLayout()
@@ -207,53 +187,110 @@ class SaveUrlDialog(QDialog):
 
         cancel_btn = QPushButton("Cancelar")
         cancel_btn.setFixedWidth(100)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: none;
-                border-radius: 3px;
-                padding: 10px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        cancel_btn.setObjectName("cancelBtn")
         cancel_btn.clicked.connect(self.reject)
         buttons_layout.addWidget(cancel_btn)
 
-        save_btn = QPushButton("Guardar")
-        save_btn.setFixedWidth(100)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #00d4ff;
-                color: #000000;
-                border: none;
-                border-radius: 3px;
-                padding: 10px;
-                font-size: 10pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00b8d4;
-            }
-        """)
-        save_btn.clicked.connect(self.validate_and_accept)
-        buttons_layout.addWidget(save_btn)
+        self.save_btn = QPushButton("Guardar")
+        self.save_btn.setFixedWidth(100)
+        self.save_btn.setObjectName("saveBtn")
+        self.save_btn.clicked.connect(self.validate_and_accept)
+        buttons_layout.addWidget(self.save_btn)
+
+        # Validación en vivo del nombre, agrupando las pulsaciones rápidas
+        self._live_validate_timer = QTimer(self)
+        self._live_validate_timer.setSingleShot(True)
+        self._live_validate_timer.setInterval(_LIVE_VALIDATE_DELAY_MS)
+        self._live_validate_timer.timeout.connect(self._live_validate)
+        self.label_input.textChanged.connect(self._schedule_live_validate)
 
         layout.addLayout(buttons_layout)
 
-        # Aplicar estilo general al dialog
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        # Aplicar la hoja de estilos completa una sola vez en la raíz
+        self.setStyleSheet(SAVE_URL_DIALOG_QSS)
+
+    def _populate_categories(self):
+        """Llena el combo con self.categories (una sola inserción de filas en el modelo)."""
+        texts = []
+        for category in self.categories:
+            icon = getattr(category, 'icon', None)
+            texts.append(f"{icon} {category.name}" if icon else category.name)
+        self.category_combo.addItems(texts)
+        for index, category in enumerate(self.categories):
+            self.category_combo.setItemData(index, category.id)
+
+    def refresh(self, current_url: str, page_title: str, categories: list):
+        """
+        Reutiliza el dialog para otra URL sin reconstruir la interfaz.
+
+        Args:
+            current_url: URL actual del navegador
+            page_title: Título de la página actual
+            categories: Lista de categorías disponibles
+        """
+        self.current_url = current_url
+        self.page_title = page_title
+        self._auto_label = page_title[:50] if page_title else "Nueva URL"
+        self.url_display.setText(current_url)
+        self.label_input.setText(self._auto_label)
+        self.description_input.clear()
 
+        # Recargar categorías conservando la última elegida si sigue existiendo
+        previous_id = self.category_combo.currentData()
+        self.categories = categories
+        self.category_combo.clear()
+        self._populate_categories()
+        index = self.category_combo.findData(previous_id)
+        if index >= 0:
+            self.category_combo.setCurrentIndex(index)
+
+        # Limpiar tags de la URL anterior (elegido en init_ui según el widget de tags)
+        self._clear_tags()
+
+    def _make_header(self, text: str, muted: bool = False) -> QLabel:
+        """
+        Crea el label de encabezado de una sección.
+
+        Args:
+            text: Texto del encabezado
+            muted: True para el estilo atenuado (campos opcionales)
+
+        Returns:
+            QLabel con el objectName que usa la hoja de estilos
+        """
+        label = QLabel(text)
+        label.setObjectName("sectionHeaderMuted" if muted else "sectionHeader")
+        return label
+
+    @pyqtSlot(bool)
+    def _ensure_tag_selector(self, checked: bool):
+        """
+        Expande/colapsa la sección de tags, creando el selector la primera vez.
+
+        Args:
+            checked: True si la sección se expande
+        """
+        self._tag_toggle.setText("Tags ▾" if checked else "Tags ▸")
+
+        if checked and self.tag_selector is None:
+            from views.widgets.project_tag_selector import ProjectTagSelector
+            self.tag_selector = ProjectTagSelector(self.global_tag_manager)
+            self.tag_selector.setMinimumHeight(150)
+            self._tags_container.layout().addWidget(self.tag_selector)
+
+        self._tags_container.setVisible(checked)
+
+    @pyqtSlot(str)
+    def _schedule_live_validate(self, _text: str):
+        """Reinicia la espera de la validación en vivo tras cada cambio de texto."""
+        self._live_validate_timer.start()
+
+    @pyqtSlot()
+    def _live_validate(self):
+        """Habilita "Guardar" solo si el nombre del item no está vacío."""
+        self.save_btn.setEnabled(bool(self.label_input.text().strip()))
+
+    @pyqtSlot()
     def validate_and_accept(self):
         """Valida los campos antes de aceptar."""
         # Validar que haya categoría seleccionada
@@ -266,37 +303,53 @@ class SaveUrlDialog(QDialog):
             QMessageBox.warning(self, "Error", "Debes ingresar un nombre para el item")
             return
 
+        # Leer los datos antes de cerrar, por si un receptor vuelve a usar el dialog
+        data = self.get_data()
         self.accept()
+        self.saved.emit(data)
 
-    def get_data(self):
+    def get_data(self) -> SaveUrlPayload:
         """
         Obtiene los datos ingresados en el dialog.
 
         Returns:
-            dict: Diccionario con los datos del item a crear
+            SaveUrlPayload: Datos del item a crear
+        """
+        return SaveUrlPayload(
+            category_id=self.category_combo.currentData(),
+            label=self.label_input.text().strip(),
+            content=self.current_url,
+            description=self.description_input.toPlainText().strip() or None,
+            tags=self._collect_tags(),  # Elegido en init_ui según el widget de tags
+        )
+
+    def _collect_tags_project(self) -> list:
+        """
+        Obtiene los nombres de los tags marcados en el ProjectTagSelector.
+
+        Returns:
+            list: Nombres de tags (vacía si la sección nunca se expandió)
+        """
+        if self.tag_selector is None:
+            return []
+        selected_ids = self.tag_selector.get_selected_tags()
+        return [tag.name for tag in self.global_tag_manager.get_tags(selected_ids)]
+
+    def _collect_tags_csv(self) -> list:
+        """
+        Obtiene los tags escritos en el QLineEdit de respaldo.
+
+        Returns:
+            list: Tags separados por coma, sin espacios ni entradas vacías
         """
-        # Obtener category_id del combo
-        category_id = self.category_combo.currentData()
-
-        # Obtener tags
-        tags = []
-        if self.tag_selector and hasattr(self.tag_selector, 'get_selected_tags'):
-            # ProjectTagSelector
-            selected_ids = self.tag_selector.get_selected_tags()
-            for tag_id in selected_ids:
-                tag = self.global_tag_manager.get_tag(tag_id)
-                if tag:
-                    tags.append(tag.name)
-        elif hasattr(self, 'tag_selector'):
-            # QLineEdit fallback
-            tags_text = self.tag_selector.text().strip()
-            tags = [tag.strip() for tag in tags_text.split(',') if tag.strip()] if tags_text else []
-
-        return {
-            'category_id': category_id,
-            'label': self.label_input.text().strip(),
-            'content': self.current_url,
-            'description': self.description_input.toPlainText().strip() or None,
-            'tags': tags,
-            'type': 'URL'
-        }
+        tags_text = self.tag_selector.text().strip()
+        return [tag.strip() for tag in tags_text.split(',') if tag.strip()] if tags_text else []
+
+    def _clear_tags_project(self):
+        """Quita los tags marcados en el ProjectTagSelector (si ya se creó)."""
+        if self.tag_selector is not None:
+            self.tag_selector.clear_selection()
+
+    def _clear_tags_csv(self):
+        """Vacía el QLineEdit de tags de respaldo."""
+        self.tag_selector.clear()
@@ -455,6 +455,7 @@ class SimpleBrowserWindow(QWidget):
         self.profile_manager = profile_manager
         self.controller = controller
         self.appbar_registered = False  # Estado del AppBar
+        self._save_url_dialog = None  # SaveUrlDialog reutilizable, se crea al primer uso
 
         # Variables para redimensionamiento
         self.resizing = False
@@ -1693,47 +1694,67 @@ class SimpleBrowserWindow(QWidget):
                 )
                 return
 
-            # Mostrar dialog
-            from src.views.dialogs.save_url_dialog import SaveUrlDialog
+            # Mostrar dialog (se crea la primera vez y luego solo se refresca)
+            if self._save_url_dialog is None:
+                from src.views.dialogs.save_url_dialog import SaveUrlDialog
 
-            db_path = str(self.db.db_path) if hasattr(self.db, 'db_path') else None
-            dialog = SaveUrlDialog(
-                current_url=current_url,
-                page_title=page_title,
-                categories=categories,
-                db_path=db_path,
-                parent=self
+                db_path = str(self.db.db_path) if hasattr(self.db, 'db_path') else None
+                self._save_url_dialog = SaveUrlDialog(
+                    current_url=current_url,
+                    page_title=page_title,
+                    categories=categories,
+                    db_path=db_path,
+                    parent=self
+                )
+                self._save_url_dialog.saved.connect(self._on_url_dialog_saved)
+            else:
+                self._save_url_dialog.refresh(current_url, page_title, categories)
+
+            # open() en lugar de exec(): sin event loop anidado, el guardado llega por señal
+            self._save_url_dialog.open()
+
+        except Exception as e:
+            logger.error(f"Error al guardar URL como item: {e}", exc_info=True)
+            from PyQt6.QtWidgets import QMessageBox
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Error al guardar URL:\n{str(e)}"
             )
 
-            if dialog.exec():
-                # Obtener datos del dialog
-                data = dialog.get_data()
+    def _on_url_dialog_saved(self, data):
+        """
+        Guarda en la base de datos la URL confirmada en SaveUrlDialog.
 
-                # Guardar item en la base de datos
-                item_id = self.db.add_item(
-                    category_id=data['category_id'],
-                    label=data['label'],
-                    content=data['content'],
-                    item_type=data['type'],
-                    description=data['description'],
-                    tags=data['tags']
-                )
+        Args:
+            data: SaveUrlPayload devuelto por SaveUrlDialog.get_data()
+        """
+        try:
+            # Guardar item en la base de datos
+            item_id = self.db.add_item(
+                category_id=data.category_id,
+                label=data.label,
+                content=data.content,
+                item_type=data.type,
+                description=data.description,
+                tags=data.tags
+            )
 
-                if item_id:
-                    from PyQt6.QtWidgets import QMessageBox
-                    QMessageBox.information(
-                        self,
-                        "Éxito",
-                        f"URL guardada exitosamente como item:\n\n{data['label']}"
-                    )
-                    logger.info(f"URL guardada como item: {data['label']} (ID: {item_id})")
-                else:
-                    from PyQt6.QtWidgets import QMessageBox
-                    QMessageBox.warning(
-                        self,
-                        "Error",
-                        "No se pudo guardar el item en la base de datos"
-                    )
+            if item_id:
+                from PyQt6.QtWidgets import QMessageBox
+                QMessageBox.information(
+                    self,
+                    "Éxito",
+                    f"URL guardada exitosamente como item:\n\n{data.label}"
+                )
+                logger.info(f"URL guardada como item: {data.label} (ID: {item_id})")
+            else:
+                from PyQt6.QtWidgets import QMessageBox
+                QMessageBox.warning(
+                    self,
+                    "Error",
+                    "No se pudo guardar el item en la base de datos"
+                )
 
         except Exception as e:
             logger.error(f"Error al guardar URL como item: {e}", exc_info=True)